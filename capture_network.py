@@ -34,14 +34,28 @@ Usage:
 
 import argparse
 import asyncio
-import datetime as dt
+import functools
+import itertools
 import json
 import logging
 import os
 import re
 import sys
-from contextlib import AsyncExitStack
-from typing import Any, Dict, Iterable, List, Optional
+import time
+from typing import (
+    Any,
+    AsyncContextManager,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 from mcp import ClientSession, types
 from mcp.client.sse import sse_client
@@ -68,11 +82,16 @@ def setup_logging() -> None:
 
 LOGGER = logging.getLogger("capture_network")
 
+# Records per buffered write when saving directly to a local file
+BATCH_LINES = 1024
+# Approximate JSONL characters per write_file/append_file call via Filesystem MCP
+CHUNK_SIZE = 1 << 20
+
 
 # Helpers
 def timestamp_yyyymmdd_hhmmss() -> str:
     """Return current local timestamp formatted as YYYYMMDD_HHMMSS."""
-    return dt.datetime.now().strftime("%Y%m%d_%H%M%S")
+    return time.strftime("%Y%m%d_%H%M%S", time.localtime())
 
 
 def expand_output_path_template(path_template: str) -> str:
@@ -92,95 +111,234 @@ def extract_tool_result_json(result: types.CallToolResult) -> Any:
         return None
 
     for content_entry in result.content:
-        # Determine entry type from attribute or mapping
-        content_type = getattr(content_entry, "type", None)
-        if content_type is None and isinstance(content_entry, dict):
-            content_type = content_entry.get("type")
+        # Classify once: mapping payloads use .get, content objects use attributes
+        is_mapping = isinstance(content_entry, dict)
+        content_type = (
+            content_entry.get("type")
+            if is_mapping
+            else getattr(content_entry, "type", None)
+        )
 
         if content_type == "json":
-            if hasattr(content_entry, "json"):
-                return getattr(content_entry, "json")
-            if isinstance(content_entry, dict):
-                return content_entry.get("json")
-            return None
+            return (
+                content_entry.get("json")
+                if is_mapping
+                else getattr(content_entry, "json", None)
+            )
 
         if content_type == "text":
-            if hasattr(content_entry, "text"):
-                text_payload = getattr(content_entry, "text") or ""
-            elif isinstance(content_entry, dict):
-                text_payload = content_entry.get("text", "") or ""
-            else:
-                text_payload = ""
+            text_payload = (
+                content_entry.get("text")
+                if is_mapping
+                else getattr(content_entry, "text", None)
+            ) or ""
             try:
                 return json.loads(text_payload)
-            except Exception:
+            except ValueError:
                 return {"text": text_payload}
 
     return None
 
 
+def iter_batches(items: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+    """Yield successive lists of at most `batch_size` items."""
+    iterator = iter(items)
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _dumps(value: Any) -> str:
+    """Encode one JSONL record compactly (no whitespace after separators)."""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
 def serialize_to_jsonl(payload: Any) -> str:
     """Serialize a list/dict payload into newline-delimited JSON (JSONL)."""
     if payload is None:
         return ""
+    # Exact-type checks first (the common case); isinstance keeps subclasses working
+    payload_type = type(payload)
+    if payload_type is dict:
+        return _dumps(payload) + "\n"
+    if payload_type is list or isinstance(payload, list):
+        if not payload:
+            return ""
+        return "\n".join([_dumps(item) for item in payload]) + "\n"
     if isinstance(payload, dict):
-        return json.dumps(payload, ensure_ascii=False) + "\n"
-    if isinstance(payload, list):
-        return "".join(json.dumps(item, ensure_ascii=False) + "\n" for item in payload)
+        return _dumps(payload) + "\n"
     # Fallback shape
-    return json.dumps({"value": payload}, ensure_ascii=False) + "\n"
+    return _dumps({"value": payload}) + "\n"
+
+
+def iter_jsonl_chunks(
+    request_records: Iterable[Dict[str, Any]], chunk_size: int
+) -> Iterator[Tuple[str, int]]:
+    """Yield (JSONL text, line count) chunks of roughly `chunk_size` characters."""
+    pending_lines: List[str] = []
+    pending_size = 0
+    for request_record in request_records:
+        jsonl_line = _dumps(request_record) + "\n"
+        pending_lines.append(jsonl_line)
+        pending_size += len(jsonl_line)
+        if pending_size >= chunk_size:
+            yield "".join(pending_lines), len(pending_lines)
+            pending_lines = []
+            pending_size = 0
+    if pending_lines:
+        yield "".join(pending_lines), len(pending_lines)
+
+
+def write_jsonl_file(
+    request_records: Iterable[Dict[str, Any]], output_path: str
+) -> int:
+    """Write request records as JSONL straight to a local file (no MCP hop).
+
+    Returns the number of lines written.
+    """
+    output_directory = os.path.dirname(output_path)
+    if output_directory:
+        os.makedirs(output_directory, exist_ok=True)
+    line_count = 0
+    with open(output_path, "w", encoding="utf-8", newline="\n") as output_file:
+        for record_batch in iter_batches(request_records, BATCH_LINES):
+            output_file.write(serialize_to_jsonl(record_batch))
+            line_count += len(record_batch)
+    return line_count
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_url_pattern(url_regex: str) -> "re.Pattern[str]":
+    """Compile (and memoize) a URL filter regex."""
+    return re.compile(url_regex)
+
+
+def _build_url_search(
+    url_regex: Optional[Union[str, Sequence[str]]],
+) -> Optional[Callable[[str], Any]]:
+    """Return a URL predicate that is truthy if any pattern matches, or None."""
+    url_patterns = (
+        (url_regex,) if isinstance(url_regex, str) else tuple(url_regex or ())
+    )
+    # Patterns compile separately so each keeps its own flags, groups and
+    # backreferences; a single pattern skips the any() scan.
+    url_searches = [_compile_url_pattern(pattern).search for pattern in url_patterns]
+    if not url_searches:
+        return None
+    if len(url_searches) == 1:
+        return url_searches[0]
 
+    def url_search(url_value: str) -> bool:
+        return any(search(url_value) for search in url_searches)
 
-def filter_network_requests(
+    return url_search
+
+
+def _status_in_range(status_value: Any, status_low: float, status_high: float) -> bool:
+    """Return False only for a parseable status outside [status_low, status_high]."""
+    if status_value is None:
+        return True
+    # JSON statuses are normally ints already; only convert otherwise
+    if type(status_value) is not int:
+        try:
+            status_value = int(status_value)
+        except (TypeError, ValueError):
+            return True
+    return status_low <= status_value <= status_high
+
+
+def iter_filtered_network_requests(
     request_records: Iterable[Dict[str, Any]],
-    url_regex: Optional[str],
+    url_regex: Optional[Union[str, Sequence[str]]],
     method_filter: Optional[str],
     status_min: Optional[int],
     status_max: Optional[int],
-) -> List[Dict[str, Any]]:
-    """Filter request dictionaries by URL regex, HTTP method, and status range."""
+) -> Iterator[Dict[str, Any]]:
+    """Lazily yield request dictionaries matching URL regex, method, and status range.
+
+    `url_regex` may be one pattern or several; a URL is kept if any matches.
+    Patterns are compiled eagerly, so a bad regex raises here, before any
+    output is written by the consumer.
+    """
     if request_records is None:
-        return []
+        return iter(())
+    # Nothing to filter (no URL/method filter, status bounds at the CLI defaults)
+    if (
+        not url_regex
+        and not method_filter
+        and (status_min is None or status_min <= 0)
+        and (status_max is None or status_max >= 999)
+    ):
+        return iter(request_records)
 
-    compiled_url_pattern = re.compile(url_regex) if url_regex else None
+    url_search = _build_url_search(url_regex)
     method_filter_upper = method_filter.upper() if method_filter else None
 
-    filtered_records: List[Dict[str, Any]] = []
+    check_status = status_min is not None or status_max is not None
+    status_low = status_min if status_min is not None else float("-inf")
+    status_high = status_max if status_max is not None else float("inf")
+
+    return _iter_matching_requests(
+        request_records,
+        url_search,
+        method_filter_upper,
+        check_status,
+        status_low,
+        status_high,
+    )
+
+
+def _iter_matching_requests(
+    request_records: Iterable[Dict[str, Any]],
+    url_search: Optional[Callable[[str], Any]],
+    method_filter_upper: Optional[str],
+    check_status: bool,
+    status_low: float,
+    status_high: float,
+) -> Iterator[Dict[str, Any]]:
+    """Yield records passing the prepared filters of iter_filtered_network_requests."""
+    # Each field is only extracted when its predicate is active, so inactive
+    # filters cost nothing per record. Keep this loop free of logging; any
+    # future log call here must sit behind LOGGER.isEnabledFor(...).
     for request_record in request_records:
-        url_value = (
-            (request_record.get("request") or {}).get("url")
-            or request_record.get("url")
-            or ""
-        )
-        method_value = (request_record.get("request") or {}).get(
-            "method"
-        ) or request_record.get("method")
-        status_value = (request_record.get("response") or {}).get(
-            "status"
-        ) or request_record.get("status")
-
-        if compiled_url_pattern and not compiled_url_pattern.search(url_value):
-            continue
-        if method_filter_upper and (
-            not method_value or str(method_value).upper() != method_filter_upper
-        ):
-            continue
-        if status_min is not None and status_value is not None:
-            try:
-                if int(status_value) < status_min:
-                    continue
-            except (TypeError, ValueError):
-                pass
-        if status_max is not None and status_value is not None:
-            try:
-                if int(status_value) > status_max:
-                    continue
-            except (TypeError, ValueError):
-                pass
+        record_get = request_record.get
+        request_part = record_get("request")
+
+        if url_search:
+            url_value = (
+                (request_part.get("url") if request_part else None)
+                or record_get("url")
+                or ""
+            )
+            if not url_search(url_value):
+                continue
+        if method_filter_upper:
+            method_value = (
+                request_part.get("method") if request_part else None
+            ) or record_get("method")
+            # Methods are usually already upper-case, so try the plain compare
+            # before paying for str()/upper().
+            if method_value != method_filter_upper and (
+                not method_value or str(method_value).upper() != method_filter_upper
+            ):
+                continue
+        if check_status:
+            response_part = record_get("response")
+            status_value = (
+                response_part.get("status") if response_part else None
+            ) or record_get("status")
+            if not _status_in_range(status_value, status_low, status_high):
+                continue
+
+        yield request_record
 
-        filtered_records.append(request_record)
 
-    return filtered_records
+@functools.lru_cache(maxsize=16)
+def _retry_delays(backoff_seconds: float, retries: int) -> Tuple[float, ...]:
+    """Return (and memoize) the exponential backoff schedule for `retries`."""
+    return tuple(backoff_seconds * (2**index) for index in range(retries))
 
 
 async def call_tool_with_retry(
@@ -192,27 +350,27 @@ async def call_tool_with_retry(
     backoff_seconds: float = 0.75,
 ) -> types.CallToolResult:
     """Call a tool with retry and exponential backoff."""
-    attempt_index = 0
     last_exception: Optional[Exception] = None
 
-    while attempt_index <= retries:
+    # asyncio.CancelledError is a BaseException, so cancellation is never retried
+    for attempt_index in range(retries + 1):
         try:
             return await client_session.call_tool(tool_name, tool_args or {})
         except Exception as exc:  # broad: MCP servers surface various error types
             last_exception = exc
-            attempt_index += 1
-            if attempt_index > retries:
+            if attempt_index == retries:
                 break
-            sleep_seconds = backoff_seconds * (2 ** (attempt_index - 1))
-            LOGGER.warning(
-                "Tool %s failed (attempt %d/%d): [%s] %s — retrying in %.2fs",
-                tool_name,
-                attempt_index,
-                retries,
-                type(exc).__name__,
-                exc,
-                sleep_seconds,
-            )
+            sleep_seconds = _retry_delays(backoff_seconds, retries)[attempt_index]
+            if LOGGER.isEnabledFor(logging.WARNING):
+                LOGGER.warning(
+                    "Tool %s failed (attempt %d/%d): [%s] %s — retrying in %.2fs",
+                    tool_name,
+                    attempt_index + 1,
+                    retries,
+                    type(exc).__name__,
+                    exc,
+                    sleep_seconds,
+                )
             await asyncio.sleep(sleep_seconds)
 
     raise RuntimeError(
@@ -222,64 +380,117 @@ async def call_tool_with_retry(
 
 # Core Client
 class NetworkCaptureClient:
-    """Owns connections to Playwright MCP (SSE) and Filesystem MCP (stdio)."""
+    """Owns connections to Playwright MCP (SSE) and Filesystem MCP (stdio).
+
+    With `filesystem_stdio_params=None` no Filesystem MCP server is started and
+    captures are written directly to the local filesystem.
+    """
 
     def __init__(
-        self, playwright_sse_url: str, filesystem_stdio_params: StdioServerParameters
+        self,
+        playwright_sse_url: str,
+        filesystem_stdio_params: Optional[StdioServerParameters],
     ):
         self.playwright_sse_url = playwright_sse_url
         self.filesystem_stdio_params = filesystem_stdio_params
-        self._exit_stack: Optional[AsyncExitStack] = None
+        # Exactly two transports and two sessions; entered/exited explicitly
+        self._filesystem_transport: Optional[AsyncContextManager[Any]] = None
+        self._playwright_transport: Optional[AsyncContextManager[Any]] = None
         self.playwright_session: Optional[ClientSession] = None
         self.filesystem_session: Optional[ClientSession] = None
+        # Tool names per session, keyed by id(session); filled on first lookup
+        self._tool_cache: Dict[int, Set[str]] = {}
 
     async def __aenter__(self):
-        self._exit_stack = AsyncExitStack()
-
-        # Playwright (SSE)
-        playwright_read_stream, playwright_write_stream = (
-            await self._exit_stack.enter_async_context(
-                sse_client(self.playwright_sse_url)
+        # Transports are entered sequentially in this task (their anyio task
+        # groups must be exited by the task that entered them). The stdio
+        # server is spawned first so its Node.js startup overlaps the SSE
+        # connect, then both handshakes run concurrently.
+        try:
+            # Filesystem (stdio)
+            if self.filesystem_stdio_params is not None:
+                filesystem_transport = stdio_client(self.filesystem_stdio_params)
+                filesystem_read_stream, filesystem_write_stream = (
+                    await filesystem_transport.__aenter__()
+                )
+                self._filesystem_transport = filesystem_transport
+                self.filesystem_session = await ClientSession(
+                    filesystem_read_stream, filesystem_write_stream
+                ).__aenter__()
+
+            # Playwright (SSE)
+            playwright_transport = sse_client(self.playwright_sse_url)
+            playwright_read_stream, playwright_write_stream = (
+                await playwright_transport.__aenter__()
             )
-        )
-        self.playwright_session = await self._exit_stack.enter_async_context(
-            ClientSession(playwright_read_stream, playwright_write_stream)
-        )
-        await self.playwright_session.initialize()
+            self._playwright_transport = playwright_transport
+            self.playwright_session = await ClientSession(
+                playwright_read_stream, playwright_write_stream
+            ).__aenter__()
 
-        # Filesystem (stdio)
-        filesystem_read_stream, filesystem_write_stream = (
-            await self._exit_stack.enter_async_context(
-                stdio_client(self.filesystem_stdio_params)
-            )
-        )
-        self.filesystem_session = await self._exit_stack.enter_async_context(
-            ClientSession(filesystem_read_stream, filesystem_write_stream)
-        )
-        await self.filesystem_session.initialize()
+            if self.filesystem_session is None:
+                await self.playwright_session.initialize()
+            else:
+                await asyncio.gather(
+                    self.playwright_session.initialize(),
+                    self.filesystem_session.initialize(),
+                )
+        except BaseException:
+            # `async with` skips __aexit__ when __aenter__ fails; close what opened
+            await self.__aexit__(*sys.exc_info())
+            raise
 
-        LOGGER.info("Connected to Playwright MCP (SSE) and Filesystem MCP (stdio)")
+        if self.filesystem_session is None:
+            LOGGER.info("Connected to Playwright MCP (SSE); writing files directly")
+        else:
+            LOGGER.info(
+                "Connected to Playwright MCP (SSE) and Filesystem MCP (stdio)"
+            )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self._exit_stack:
-            await self._exit_stack.__aexit__(exc_type, exc_val, exc_tb)
-        self._exit_stack = None
+        # Reverse order of entry; each close runs even if an earlier one raised
+        teardown_error: Optional[BaseException] = None
+        for resource in (
+            self.playwright_session,
+            self._playwright_transport,
+            self.filesystem_session,
+            self._filesystem_transport,
+        ):
+            if resource is None:
+                continue
+            try:
+                await resource.__aexit__(exc_type, exc_val, exc_tb)
+            except BaseException as exc:
+                teardown_error = teardown_error or exc
+        self._playwright_transport = None
+        self._filesystem_transport = None
         self.playwright_session = None
         self.filesystem_session = None
+        self._tool_cache.clear()
         LOGGER.info("Disconnected MCP sessions")
+        if teardown_error is not None:
+            raise teardown_error
 
     async def tool_is_available(
         self, client_session: ClientSession, tool_name: str
     ) -> bool:
-        """Return True iff `tool_name` exists in the given MCP client session."""
+        """Return True iff `tool_name` exists in the given MCP client session.
+
+        The session's tool catalog is fetched once and cached until disconnect.
+        """
+        tool_names = self._tool_cache.get(id(client_session))
+        if tool_names is not None:
+            return tool_name in tool_names
         try:
             tools = await client_session.list_tools()
-            return any(
-                tool_descriptor.name == tool_name for tool_descriptor in tools.tools
+            tool_names = {tool_descriptor.name for tool_descriptor in tools.tools}
+            self._tool_cache[id(client_session)] = tool_names
+            return tool_name in tool_names
         except Exception as exc:
-            LOGGER.warning("Error checking tool availability for '%s': %s", tool_name, exc)
-            return False
+            LOGGER.warning(
+                "Error checking tool availability for '%s': %s", tool_name, exc
+            )
             return False
 
     async def capture_network_requests(
@@ -292,40 +503,49 @@ class NetworkCaptureClient:
         assert self.playwright_session, "Playwright session not initialized"
 
         LOGGER.info("Navigating to %s", navigate_url)
-        await call_tool_with_retry(
+        navigate_call = call_tool_with_retry(
             self.playwright_session, "browser_navigate", {"url": navigate_url}
         )
+        if wait_mode == "networkidle":
+            # Look up browser_wait_for while navigation is in flight
+            _, wait_for_available = await asyncio.gather(
+                navigate_call,
+                self.tool_is_available(self.playwright_session, "browser_wait_for"),
+            )
+        else:
+            # Sleep-based waits never need the tool; skip the lookup
+            await navigate_call
+            wait_for_available = False
 
         # Prefer semantic waiting if available; otherwise sleep fallback.
-        if await self.tool_is_available(self.playwright_session, "browser_wait_for"):
-            if wait_mode == "sleep":
-                LOGGER.info("Waiting (sleep) for %.2fs", wait_timeout_seconds)
-                await asyncio.sleep(wait_timeout_seconds)
-            elif wait_mode == "networkidle":
-                LOGGER.info(
-                    "Waiting for state=networkidle (timeout=%ss)",
-                    int(wait_timeout_seconds),
-                )
-                await call_tool_with_retry(
-                    self.playwright_session,
-                    "browser_wait_for",
-                    {
-                        "state": "networkidle",
-                        "timeout": int(wait_timeout_seconds * 1000),
-                    },
-                )
-            else:
-                LOGGER.info(
-                    "Unknown wait_mode=%s — defaulting to sleep %.2fs",
-                    wait_mode,
-                    wait_timeout_seconds,
-                )
-                await asyncio.sleep(wait_timeout_seconds)
-        else:
+        if wait_mode == "sleep":
+            LOGGER.info("Waiting (sleep) for %.2fs", wait_timeout_seconds)
+            await asyncio.sleep(wait_timeout_seconds)
+        elif wait_mode == "networkidle" and wait_for_available:
+            LOGGER.info(
+                "Waiting for state=networkidle (timeout=%ss)",
+                int(wait_timeout_seconds),
+            )
+            await call_tool_with_retry(
+                self.playwright_session,
+                "browser_wait_for",
+                {
+                    "state": "networkidle",
+                    "timeout": int(wait_timeout_seconds * 1000),
+                },
+            )
+        elif wait_mode == "networkidle":
             LOGGER.info(
                 "browser_wait_for not available — sleeping %.2fs", wait_timeout_seconds
             )
             await asyncio.sleep(wait_timeout_seconds)
+        else:
+            LOGGER.info(
+                "Unknown wait_mode=%s — defaulting to sleep %.2fs",
+                wait_mode,
+                wait_timeout_seconds,
+            )
+            await asyncio.sleep(wait_timeout_seconds)
 
         LOGGER.info("Fetching network requests")
         call_result = await call_tool_with_retry(
@@ -347,11 +567,23 @@ class NetworkCaptureClient:
         return [{"value": network_payload}]
 
     async def save_jsonl(
-        self, request_records: List[Dict[str, Any]], output_path: str
-    ) -> str:
-        """Persist request records as JSONL to `output_path` via Filesystem MCP."""
-        assert self.filesystem_session, "Filesystem session not initialized"
+        self, request_records: Iterable[Dict[str, Any]], output_path: str
+    ) -> Tuple[str, int]:
+        """Persist request records as JSONL to `output_path` via Filesystem MCP.
+
+        Records are consumed lazily, so a generator is streamed rather than
+        materialized. Without a Filesystem MCP server (direct mode) the file is
+        written locally. Returns the written path and its line count.
+        """
         expanded_output_path = expand_output_path_template(output_path)
+        if self.filesystem_stdio_params is None:
+            line_count = write_jsonl_file(request_records, expanded_output_path)
+            LOGGER.info(
+                "Saved %d lines to %s (direct)", line_count, expanded_output_path
+            )
+            return expanded_output_path, line_count
+
+        assert self.filesystem_session, "Filesystem session not initialized"
         output_directory = os.path.dirname(expanded_output_path)
 
         # Best-effort create directory if tool exists
@@ -366,14 +598,42 @@ class NetworkCaptureClient:
             except Exception as exc:
                 LOGGER.warning("create_directory failed (non-fatal): %s", exc)
 
-        jsonl_blob = serialize_to_jsonl(request_records)
-        await call_tool_with_retry(
-            self.filesystem_session,
-            "write_file",
-            {"path": expanded_output_path, "content": jsonl_blob},
-        )
-        LOGGER.info("Saved %d lines to %s", len(request_records), expanded_output_path)
-        return expanded_output_path
+        # Stream CHUNK_SIZE pieces when the server can append, so the full JSONL
+        # blob is never held in memory; appends stay sequential to keep order.
+        # Only write_file is retried: a retried append whose first attempt did
+        # land (e.g. lost response) would duplicate the chunk.
+        line_count = 0
+        if await self.tool_is_available(self.filesystem_session, "append_file"):
+            first_chunk_done = False
+            for jsonl_chunk, chunk_line_count in iter_jsonl_chunks(
+                request_records, CHUNK_SIZE
+            ):
+                await call_tool_with_retry(
+                    self.filesystem_session,
+                    "append_file" if first_chunk_done else "write_file",
+                    {"path": expanded_output_path, "content": jsonl_chunk},
+                    retries=0 if first_chunk_done else 2,
+                )
+                first_chunk_done = True
+                line_count += chunk_line_count
+            if not first_chunk_done:
+                # No records: still create/truncate the output file
+                await call_tool_with_retry(
+                    self.filesystem_session,
+                    "write_file",
+                    {"path": expanded_output_path, "content": ""},
+                )
+        else:
+            record_list = list(request_records)
+            jsonl_blob = serialize_to_jsonl(record_list)
+            await call_tool_with_retry(
+                self.filesystem_session,
+                "write_file",
+                {"path": expanded_output_path, "content": jsonl_blob},
+            )
+            line_count = len(record_list)
+        LOGGER.info("Saved %d lines to %s", line_count, expanded_output_path)
+        return expanded_output_path, line_count
 
 
 # CLI Code Glue
@@ -409,6 +669,12 @@ def build_parser() -> argparse.ArgumentParser:
         ),
         help="Output JSONL path (supports {ts}).",
     )
+    parser.add_argument(
+        "--direct-fs",
+        action="store_true",
+        default=os.getenv("CAPTURE_DIRECT_FS", "").lower() in ("1", "true", "yes"),
+        help="Write the JSONL file directly instead of via Filesystem MCP.",
+    )
     parser.add_argument(
         "--wait",
         type=float,
@@ -425,8 +691,9 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--filter-url",
         type=str,
-        default=os.getenv("CAPTURE_FILTER_URL", None),
-        help="Python regex to filter request URLs.",
+        action="append",
+        default=None,
+        help="Python regex to filter request URLs (repeatable; any match keeps).",
     )
     parser.add_argument(
         "--filter-method",
@@ -454,9 +721,14 @@ async def run_async(argv: List[str]) -> int:
     setup_logging()
     parser = build_parser()
     cli_args = parser.parse_args(argv)
-
-    filesystem_stdio_params = StdioServerParameters(
-        command=cli_args.fs_cmd, args=cli_args.fs_args
+    # Set after parsing so --filter-url replaces (not extends) the env pattern
+    if cli_args.filter_url is None and os.getenv("CAPTURE_FILTER_URL"):
+        cli_args.filter_url = [os.environ["CAPTURE_FILTER_URL"]]
+
+    filesystem_stdio_params = (
+        None
+        if cli_args.direct_fs
+        else StdioServerParameters(command=cli_args.fs_cmd, args=cli_args.fs_args)
     )
 
     try:
@@ -468,18 +740,22 @@ async def run_async(argv: List[str]) -> int:
                 cli_args.url, cli_args.wait_mode, cli_args.wait
             )
 
-            # Client-side filtering
-            filtered_requests = filter_network_requests(
+            # Client-side filtering, streamed straight into the JSONL writer
+            filtered_requests = iter_filtered_network_requests(
                 captured_requests,
                 url_regex=cli_args.filter_url,
                 method_filter=cli_args.filter_method,
                 status_min=cli_args.status_min,
                 status_max=cli_args.status_max,
             )
+            saved_output_path, saved_line_count = await capture_client.save_jsonl(
+                filtered_requests, cli_args.out
+            )
+
             # Use parser defaults for status_min and status_max to avoid magic numbers
             status_min_default = parser.get_default("status_min")
             status_max_default = parser.get_default("status_max")
-            if (
+            if LOGGER.isEnabledFor(logging.INFO) and (
                 cli_args.filter_url
                 or cli_args.filter_method
                 or cli_args.status_min != status_min_default
@@ -488,12 +764,9 @@ async def run_async(argv: List[str]) -> int:
                 LOGGER.info(
                     "Filtered %d → %d requests",
                     len(captured_requests),
-                    len(filtered_requests),
+                    saved_line_count,
                 )
-            else:
-                filtered_requests = captured_requests
-                filtered_requests, cli_args.out
-            )
+
             # Print the final path for shell pipelines
             print(saved_output_path)
             return 0
@@ -507,8 +780,19 @@ async def run_async(argv: List[str]) -> int:
 
 
 def main() -> None:
-    """Sync entrypoint."""
-    raise SystemExit(asyncio.run(run_async(sys.argv[1:])))
+    """Sync entrypoint; runs on uvloop when it is installed."""
+    try:
+        import uvloop  # optional: faster event loop (Linux/macOS)
+    except ImportError:
+        uvloop = None
+
+    run_kwargs: Dict[str, Any] = {}
+    if uvloop is not None:
+        if sys.version_info >= (3, 12):
+            run_kwargs["loop_factory"] = uvloop.new_event_loop
+        else:
+            uvloop.install()
+    raise SystemExit(asyncio.run(run_async(sys.argv[1:]), **run_kwargs))
 
 
 if __name__ == "__main__":